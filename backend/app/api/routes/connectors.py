@@ -53,7 +53,7 @@ async def create_connector(
         user_id=ctx.user_id,
         project_id=ctx.project_id,
         access_level="team",
-        acl_groups=list(ctx.groups) if ctx.groups else [],
+        acl_groups=sorted(ctx.groups),
     )
     db.add(record)
     await db.commit()
@@ -108,7 +108,7 @@ async def ingest_document(
             logger.warning("Embedding client init failed", error=str(e))
 
     # Build ACL groups from user context
-    acl_groups = list(ctx.groups) if ctx.groups else []
+    acl_groups = sorted(ctx.groups)
 
     # Persist document record
     doc = Document(
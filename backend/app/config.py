@@ -23,6 +23,7 @@ class Settings(BaseSettings):
     postgres_db: str = "doc_ingestion"
     postgres_user: str = "dir_admin"
     postgres_password: str = "changeme"
+    postgres_statement_cache_size: int = 1024  # asyncpg prepared statements per connection
 
     @property
     def database_url(self) -> str:
@@ -50,6 +51,11 @@ class Settings(BaseSettings):
     # ---- Temporal ----
     temporal_host: str = "localhost:7233"
     temporal_namespace: str = "default"
+    temporal_max_concurrent_activities: int = 100
+    # Extraction processes per worker. Each one loads its own Docling
+    # DocumentConverter (layout + table models, ~1-2 GB resident), so
+    # raise this only as far as worker memory allows.
+    extraction_workers: int = 2
 
     # ---- Auth ----
     auth_required: bool = False
@@ -11,10 +11,11 @@ NIST AI RMF: GOVERN 1.2 (Accountability), MAP 1.5 (Boundaries)
 """
 
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Role(str, Enum):
@@ -27,6 +28,12 @@ class Role(str, Enum):
     AGENT = "agent"  # AI agents / service accounts
 
 
+# Roles that can access system-ingested resources (user_id="system").
+# Lives here so SecurityContext can precompute its flag without importing
+# the access policy; ResourceAccessPolicy.SYSTEM_RESOURCE_ROLES mirrors it.
+SYSTEM_RESOURCE_ROLES = (Role.ADMIN, Role.ANALYST, Role.PM)
+
+
 class SecurityContext(BaseModel):
     """
     Layer 1: Identity and Access Control.
@@ -34,7 +41,12 @@ class SecurityContext(BaseModel):
     Injected into every authenticated request via get_current_user().
     Used by ResourceAccessPolicy to enforce tenant, project, team,
     and user-level isolation across all resource types.
+
+    Frozen: the role flags below are cached on first use, so a context
+    must not change after it is built.
     """
+    model_config = ConfigDict(frozen=True)
+
     user_id: str
     tenant_id: str = "default"
     session_id: str = ""
@@ -44,12 +56,13 @@ class SecurityContext(BaseModel):
     team_id: Optional[str] = None
 
     # RBAC
-    roles: list[Role] = Field(default_factory=list)
+    roles: tuple[Role, ...] = ()
     scopes: list[str] = Field(default_factory=list)
 
     # OIDC 'groups' claim — used for team/department ACL matching
     # e.g., ["engineering", "security", "Dept:Finance"]
-    groups: list[str] = Field(default_factory=list)
+    # Stored as a frozenset: hashed once here, probed per access check.
+    groups: frozenset[str] = Field(default_factory=frozenset)
 
     # Identity metadata
     email: Optional[str] = None
@@ -60,13 +73,28 @@ class SecurityContext(BaseModel):
     is_agent: bool = False
     agent_id: Optional[str] = None
 
+    @cached_property
+    def role_set(self) -> frozenset[Role]:
+        """Roles as a frozenset — O(1) membership for per-resource checks."""
+        return frozenset(self.roles)
+
+    @cached_property
+    def is_admin(self) -> bool:
+        """Tenant admin — computed once, checked on every access decision."""
+        return Role.ADMIN in self.role_set
+
+    @cached_property
+    def can_view_system(self) -> bool:
+        """Whether any role grants access to system-ingested resources."""
+        return not self.role_set.isdisjoint(SYSTEM_RESOURCE_ROLES)
+
     def has_role(self, role: Role) -> bool:
         """Check if user has a specific role. Admin implies all roles."""
-        return role in self.roles or Role.ADMIN in self.roles
+        return role in self.role_set or self.is_admin
 
     def has_scope(self, scope: str) -> bool:
         """Check if user has a specific scope. Admin bypasses scope checks."""
-        if Role.ADMIN in self.roles:
+        if self.is_admin:
             return True
         return scope in self.scopes
 
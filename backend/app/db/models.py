@@ -22,6 +22,22 @@ class Base(DeclarativeBase):
     pass
 
 
+class BinaryVector(Vector):
+    """
+    pgvector column whose writes skip the text round trip on asyncpg.
+
+    The session registers a binary `vector` codec, so lists / ndarrays are
+    bound as-is; pgvector's own bind processor would first format every
+    float to text for the codec to parse back. Other drivers keep it.
+    """
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        if dialect.driver == "asyncpg":
+            return None
+        return super().bind_processor(dialect)
+
+
 class Document(Base):
     """An ingested document."""
     __tablename__ = "documents"
@@ -56,6 +72,8 @@ class Document(Base):
     __table_args__ = (
         Index("ix_documents_tenant_class", "tenant_id", "data_class"),
         Index("ix_documents_access", "tenant_id", "access_level", "project_id"),
+        Index("ix_documents_owner", "tenant_id", "user_id"),
+        Index("ix_documents_acl_groups", "acl_groups", postgresql_using="gin"),
     )
 
 
@@ -66,7 +84,7 @@ class ChunkRecord(Base):
     id = Column(String(64), primary_key=True)
     document_id = Column(String(64), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
     text = Column(Text, nullable=False)
-    embedding = Column(Vector(1536))  # text-embedding-ada-002 = 1536 dims
+    embedding = Column(BinaryVector(1536))  # text-embedding-ada-002 = 1536 dims
     element_type = Column(String(32))
     page = Column(Integer)
     row_index = Column(Integer)
@@ -96,6 +114,8 @@ class ChunkRecord(Base):
               postgresql_ops={"embedding": "vector_cosine_ops"}),
         Index("ix_chunks_tenant_class", "tenant_id", "data_class"),
         Index("ix_chunks_access", "tenant_id", "access_level", "project_id"),
+        Index("ix_chunks_owner", "tenant_id", "user_id"),
+        Index("ix_chunks_acl_groups", "acl_groups", postgresql_using="gin"),
     )
 
 
@@ -117,7 +137,9 @@ class GraphNodeRecord(Base):
 
     __table_args__ = (
         Index("ix_graph_nodes_label", "label"),
-        Index("ix_graph_nodes_access", "tenant_id", "access_level"),
+        Index("ix_graph_nodes_access", "tenant_id", "access_level", "project_id"),
+        Index("ix_graph_nodes_owner", "tenant_id", "user_id"),
+        Index("ix_graph_nodes_acl_groups", "acl_groups", postgresql_using="gin"),
     )
 
 
@@ -3,14 +3,53 @@ Database Session — Async SQLAlchemy
 =====================================
 """
 
+from pgvector import Vector
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from app.config import settings
 from app.db.models import Base
 
-engine = create_async_engine(settings.database_url, echo=False, pool_size=20)
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    pool_size=20,
+    connect_args={
+        "prepared_statement_cache_size": settings.postgres_statement_cache_size,
+    },
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def _encode_vector(value) -> bytes:
+    """Encode a vector parameter in pgvector's binary wire format."""
+    # ORM and raw-query binds arrive as lists / ndarrays (see BinaryVector);
+    # text ("[0.1,0.2,...]") only from callers that pre-render it.
+    if isinstance(value, str):
+        value = [float(v) for v in value.strip("[]").split(",")]
+    if not isinstance(value, Vector):
+        value = Vector(value)
+    return value.to_binary()
+
+
+async def _set_vector_codec(conn) -> None:
+    """Send/receive `vector` values as binary instead of text."""
+    try:
+        await conn.set_type_codec(
+            "vector",
+            encoder=_encode_vector,
+            decoder=Vector.from_binary,
+            format="binary",
+        )
+    except ValueError:
+        # Extension not installed yet — init_db() registers after creating it
+        pass
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    dbapi_connection.run_async(_set_vector_codec)
+
+
 async def init_db():
     """Create all tables (dev convenience — use Alembic in prod)."""
     async with engine.begin() as conn:
@@ -21,6 +60,8 @@ async def init_db():
         await conn.execute(
             __import__("sqlalchemy").text("CREATE EXTENSION IF NOT EXISTS pg_trgm")
         )
+        raw = await conn.get_raw_connection()
+        await _set_vector_codec(raw.driver_connection)
         await conn.run_sync(Base.metadata.create_all)
 
 
@@ -4,11 +4,47 @@ Extraction Engine — Base Interface
 All extraction engines implement this interface.
 """
 
+import asyncio
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import List
 
 from app.router.models import Chunk
 
+# tmpfs-backed spool directory — keeps path-only engines off the disk
+SPOOL_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _spool_dir_for(size: int):
+    """SPOOL_DIR if it has room for *size* bytes, else the default temp dir."""
+    if SPOOL_DIR is None:
+        return None
+    try:
+        st = os.statvfs(SPOOL_DIR)
+    except OSError:
+        return None
+    # /dev/shm is RAM and only 64 MB under Docker's default shm_size;
+    # large uploads go to disk rather than fail (and exhaust it)
+    return SPOOL_DIR if size < st.f_bavail * st.f_frsize else None
+
+
+def _spool_to_tmp(content: bytes, suffix: str) -> str:
+    """Write content to a temp file and return its path (blocking)."""
+    with tempfile.NamedTemporaryFile(
+        suffix=suffix, dir=_spool_dir_for(len(content)), delete=False
+    ) as tmp:
+        try:
+            tmp.write(content)
+        except BaseException:
+            # The caller never sees the path of a failed spool, so remove
+            # the partial file here (on tmpfs it would otherwise pin RAM)
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+        return tmp.name
+
 
 class BaseEngine(ABC):
     """Abstract base for document extraction engines."""
@@ -26,16 +62,53 @@ class BaseEngine(ABC):
         """
         ...
 
+    async def extract_bytes(self, content: bytes, filename: str) -> List[Chunk]:
+        """
+        Extract chunks from in-memory content (e.g. a file upload).
+
+        Engines that can read file-like objects override this to skip
+        the filesystem entirely. The default spools the content to a
+        tmpfs-backed temp file for engines that need a real path.
+
+        Args:
+            content: Raw file bytes.
+            filename: Original filename (used for type detection).
+
+        Returns:
+            List of Chunk objects with text and metadata.
+        """
+        # Multi-MB writes would otherwise stall the event loop. A failed
+        # spool removes its own partial file; the finally below only
+        # covers spools that completed.
+        tmp_path = await asyncio.to_thread(
+            _spool_to_tmp, content, Path(filename).suffix
+        )
+
+        try:
+            return await self.extract(tmp_path)
+        finally:
+            try:
+                await asyncio.to_thread(Path(tmp_path).unlink)
+            except Exception:
+                pass
+
     async def _simple_fallback(self, file_path: str) -> List[Chunk]:
         """Plain-text paragraph splitting as last resort."""
         try:
             with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                 content = f.read()
-
-            paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
-            return [
-                Chunk(text=p, metadata={"element_type": "text"})
-                for p in paragraphs
-            ]
+            return self._split_paragraphs(content)
         except Exception:
             return []
+
+    async def _simple_fallback_bytes(self, content: bytes) -> List[Chunk]:
+        """In-memory variant of _simple_fallback()."""
+        return self._split_paragraphs(content.decode("utf-8", errors="ignore"))
+
+    @staticmethod
+    def _split_paragraphs(content: str) -> List[Chunk]:
+        paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
+        return [
+            Chunk(text=p, metadata={"element_type": "text"})
+            for p in paragraphs
+        ]
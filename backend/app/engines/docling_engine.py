@@ -23,12 +23,20 @@ logger = structlog.get_logger()
 class DoclingEngine(BaseEngine):
     """Class A engine — high-fidelity extraction via IBM Docling."""
 
-    async def extract(self, file_path: str) -> List[Chunk]:
-        try:
+    def __init__(self):
+        self._converter = None
+
+    def _get_converter(self):
+        """Build the DocumentConverter (and its model weights) once."""
+        if self._converter is None:
             from docling.document_converter import DocumentConverter
 
-            converter = DocumentConverter()
-            result = converter.convert(file_path)
+            self._converter = DocumentConverter()
+        return self._converter
+
+    async def extract(self, file_path: str) -> List[Chunk]:
+        try:
+            result = self._get_converter().convert(file_path)
 
             chunks = []
             for element in result.document.elements:
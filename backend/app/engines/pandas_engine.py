@@ -9,9 +9,10 @@ rows directly to vector-ready chunks.
 NIST AI RMF: MEASURE 2.1 — Extraction quality is auditable.
 """
 
+import io
 import structlog
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, Union
 
 from app.engines.base import BaseEngine
 from app.router.models import Chunk, ChunkMetadata
@@ -23,35 +24,42 @@ class PandasEngine(BaseEngine):
     """Class C engine — structured data via Pandas."""
 
     async def extract(self, file_path: str) -> List[Chunk]:
+        return self._extract(file_path, Path(file_path).suffix.lower())
+
+    async def extract_bytes(self, content: bytes, filename: str) -> List[Chunk]:
+        return self._extract(io.BytesIO(content), Path(filename).suffix.lower())
+
+    def _extract(self, source: Union[str, BinaryIO], ext: str) -> List[Chunk]:
+        """Read a path or file-like object into row chunks."""
         try:
             import pandas as pd
         except ImportError:
             logger.warning("Pandas not installed")
             return []
 
-        ext = Path(file_path).suffix.lower()
-
         try:
             if ext == ".csv":
-                df = pd.read_csv(file_path)
+                df = pd.read_csv(source)
             elif ext == ".parquet":
-                df = pd.read_parquet(file_path)
+                df = pd.read_parquet(source)
             elif ext in (".json", ".jsonl"):
-                df = pd.read_json(file_path, lines=(ext == ".jsonl"))
+                df = pd.read_json(source, lines=(ext == ".jsonl"))
             elif ext == ".xlsx":
-                df = pd.read_excel(file_path)
+                df = pd.read_excel(source)
             elif ext == ".log":
-                df = pd.read_csv(file_path, sep=r"\s+", engine="python", on_bad_lines="skip")
+                df = pd.read_csv(source, sep=r"\s+", engine="python", on_bad_lines="skip")
             else:
                 logger.warning("Unsupported extension for Pandas", ext=ext)
                 return []
 
-            columns = list(df.columns)
+            columns = [str(c) for c in df.columns]
 
+            # Values are already well-typed here, so skip per-row
+            # validation (columns alone would be re-validated per row).
             chunks = [
-                Chunk(
+                Chunk.model_construct(
                     text=row.to_json(),
-                    metadata=ChunkMetadata(
+                    metadata=ChunkMetadata.model_construct(
                         element_type="structured_row",
                         row_index=int(idx),
                         columns=columns,
@@ -11,6 +11,7 @@ Provides:
 NIST AI RMF: MEASURE 2.1 — Extraction quality is auditable.
 """
 
+import io
 import structlog
 from typing import List
 
@@ -28,20 +29,7 @@ class UnstructuredEngine(BaseEngine):
             from unstructured.partition.auto import partition
 
             elements = partition(filename=file_path)
-
-            chunks = [
-                Chunk(
-                    text=str(element),
-                    metadata=ChunkMetadata(
-                        element_type=getattr(element, "category", "text"),
-                    ),
-                )
-                for element in elements
-                if str(element).strip()
-            ]
-
-            logger.info("Unstructured extraction complete", chunks=len(chunks))
-            return chunks
+            return self._to_chunks(elements)
 
         except ImportError:
             logger.warning(
@@ -51,3 +39,36 @@ class UnstructuredEngine(BaseEngine):
         except Exception as e:
             logger.error("Unstructured extraction failed", error=str(e))
             return await self._simple_fallback(file_path)
+
+    async def extract_bytes(self, content: bytes, filename: str) -> List[Chunk]:
+        try:
+            from unstructured.partition.auto import partition
+
+            elements = partition(
+                file=io.BytesIO(content), metadata_filename=filename
+            )
+            return self._to_chunks(elements)
+
+        except ImportError:
+            logger.warning(
+                "Unstructured not installed — falling back to simple extraction"
+            )
+            return await self._simple_fallback_bytes(content)
+        except Exception as e:
+            logger.error("Unstructured extraction failed", error=str(e))
+            return await self._simple_fallback_bytes(content)
+
+    def _to_chunks(self, elements) -> List[Chunk]:
+        chunks = [
+            Chunk(
+                text=str(element),
+                metadata=ChunkMetadata(
+                    element_type=getattr(element, "category", "text"),
+                ),
+            )
+            for element in elements
+            if str(element).strip()
+        ]
+
+        logger.info("Unstructured extraction complete", chunks=len(chunks))
+        return chunks
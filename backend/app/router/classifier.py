@@ -12,7 +12,11 @@ NIST AI RMF: MAP 1.5 (Boundaries), MANAGE 2.3 (Data Governance)
 Part of the Context Ecology (ctxEco) platform.
 """
 
+import asyncio
+import functools
 import logging
+import sys
+import threading
 import uuid
 import os
 from typing import List, Optional, Tuple
@@ -36,21 +40,38 @@ logger = structlog.get_logger()
 # ---------------------------------------------------------------------------
 # File-type → Class mappings
 # ---------------------------------------------------------------------------
-CLASS_A_EXTENSIONS = {".pdf", ".scidoc"}
-CLASS_B_EXTENSIONS = {".pptx", ".docx", ".doc", ".eml", ".msg", ".html", ".md", ".txt"}
-CLASS_C_EXTENSIONS = {".csv", ".parquet", ".json", ".log", ".jsonl", ".xlsx"}
+CLASS_A_EXTENSIONS = frozenset(sys.intern(e) for e in (".pdf", ".scidoc"))
+CLASS_B_EXTENSIONS = frozenset(
+    sys.intern(e)
+    for e in (".pptx", ".docx", ".doc", ".eml", ".msg", ".html", ".md", ".txt")
+)
+CLASS_C_EXTENSIONS = frozenset(
+    sys.intern(e)
+    for e in (".csv", ".parquet", ".json", ".log", ".jsonl", ".xlsx")
+)
 
 # Keywords indicating technical / immutable content
-TRUTH_KEYWORDS = {
+TRUTH_KEYWORDS = frozenset({
     "manual", "spec", "specification", "standard", "iso", "safety",
     "protocol", "procedure", "guideline", "regulation", "compliance",
     "datasheet", "technical", "engineering", "reference", "nist",
     "fedramp", "stig", "cve", "policy",
-}
+})
 
 # Sensitivity keywords
-HIGH_SENSITIVITY_KEYWORDS = {"secret", "credential", "password", "ssn", "pii", "phi", "cui"}
-MODERATE_SENSITIVITY_KEYWORDS = {"proprietary", "internal", "confidential", "draft"}
+HIGH_SENSITIVITY_KEYWORDS = frozenset({"secret", "credential", "password", "ssn", "pii", "phi", "cui"})
+MODERATE_SENSITIVITY_KEYWORDS = frozenset({"proprietary", "internal", "confidential", "draft"})
+
+# Filename keyword → data category (several keywords may share a category)
+CATEGORY_KEYWORDS = {
+    "pii": DataCategory.PII,
+    "ssn": DataCategory.PII,
+    "phi": DataCategory.PHI,
+    "hipaa": DataCategory.PHI,
+    "cui": DataCategory.CUI,
+    "safety": DataCategory.SAFETY,
+    "proprietary": DataCategory.PROPRIETARY,
+}
 
 # Decay rates per class
 DECAY_RATES = {
@@ -82,20 +103,40 @@ class DocumentIngestionRouter:
             os.getenv("DOCLING_ENABLED", "true").lower() == "true"
         )
         self._engines = {}
+        self._engine_factories = {}
+        self._engines_lock = threading.Lock()
         self._init_engines()
+        # Classification is a pure function of (ext, filename); memoize it
+        # per router so batch ingest / reindex sweeps skip repeat work.
+        self._classify_cached = functools.lru_cache(maxsize=4096)(
+            self._classify_impl
+        )
 
     def _init_engines(self):
-        """Lazy-load extraction engines."""
+        """Register engine factories; engines are built on first use."""
         from app.engines.docling_engine import DoclingEngine
         from app.engines.unstructured_engine import UnstructuredEngine
         from app.engines.pandas_engine import PandasEngine
 
-        self._engines = {
-            DataClass.CLASS_A_TRUTH: DoclingEngine(),
-            DataClass.CLASS_B_CHATTER: UnstructuredEngine(),
-            DataClass.CLASS_C_OPS: PandasEngine(),
+        self._engine_factories = {
+            DataClass.CLASS_A_TRUTH: DoclingEngine,
+            DataClass.CLASS_B_CHATTER: UnstructuredEngine,
+            DataClass.CLASS_C_OPS: PandasEngine,
         }
 
+    def _get_engine(self, data_class: DataClass):
+        """Return the engine for a class, instantiating it on first use."""
+        engine = self._engines.get(data_class)
+        if engine is None:
+            factory = self._engine_factories.get(data_class)
+            if factory is None:
+                return None
+            with self._engines_lock:
+                engine = self._engines.get(data_class)
+                if engine is None:
+                    engine = self._engines[data_class] = factory()
+        return engine
+
     # -----------------------------------------------------------------
     # Classification
     # -----------------------------------------------------------------
@@ -107,9 +148,22 @@ class DocumentIngestionRouter:
         NIST SP 800-60  — Sensitivity classification (High / Moderate / Low).
         """
         path = Path(file_path)
-        ext = path.suffix.lower()
-        filename_lower = path.name.lower()
-
+        cached = self._classify_cached(
+            sys.intern(path.suffix.lower()), path.name.lower()
+        )
+        # Copy the model and its two lists (not a full deepcopy, which costs
+        # more than reclassifying) so callers — force_class overrides, chunk
+        # metadata sharing the lists — never mutate the cache
+        return cached.model_copy(update={
+            "data_categories": list(cached.data_categories),
+            "compliance_frameworks": list(cached.compliance_frameworks),
+        })
+
+    def clear_classification_cache(self) -> None:
+        """Drop memoized classifications (call after keyword/config changes)."""
+        self._classify_cached.cache_clear()
+
+    def _classify_impl(self, ext: str, filename_lower: str) -> ClassificationResult:
         # --- Data class ---
         data_class, reason = self._classify_by_extension(ext, filename_lower)
 
@@ -154,18 +208,11 @@ class DocumentIngestionRouter:
         return SensitivityLevel.LOW
 
     def _detect_categories(self, filename: str) -> List[DataCategory]:
-        cats = []
-        if "pii" in filename or "ssn" in filename:
-            cats.append(DataCategory.PII)
-        if "phi" in filename or "hipaa" in filename:
-            cats.append(DataCategory.PHI)
-        if "cui" in filename:
-            cats.append(DataCategory.CUI)
-        if "safety" in filename:
-            cats.append(DataCategory.SAFETY)
-        if "proprietary" in filename:
-            cats.append(DataCategory.PROPRIETARY)
-        return cats or [DataCategory.INTERNAL]
+        # dict.fromkeys dedupes while keeping CATEGORY_KEYWORDS order
+        cats = dict.fromkeys(
+            cat for kw, cat in CATEGORY_KEYWORDS.items() if kw in filename
+        )
+        return list(cats) or [DataCategory.INTERNAL]
 
     def _detect_frameworks(self, filename: str) -> List[str]:
         frameworks = []
@@ -182,6 +229,23 @@ class DocumentIngestionRouter:
     # -----------------------------------------------------------------
     # Ingestion
     # -----------------------------------------------------------------
+    def ingest_sync(
+        self,
+        file_path: str,
+        filename: Optional[str] = None,
+        force_class: Optional[DataClass] = None,
+        user_id: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        acl_groups: Optional[List[str]] = None,
+    ) -> Tuple[List[Chunk], ClassificationResult]:
+        """
+        Blocking ingest() for callers without an event loop
+        (e.g. extraction worker processes).
+        """
+        return asyncio.run(
+            self.ingest(file_path, filename, force_class, user_id, tenant_id, acl_groups)
+        )
+
     async def ingest(
         self,
         file_path: str,
@@ -199,8 +263,52 @@ class DocumentIngestionRouter:
         - MANAGE 2.3:  Classification determines processing
         - MEASURE 2.1: Extraction quality auditable
         """
-        display_name = filename or Path(file_path).name
+        return await self._ingest(
+            file_path=file_path,
+            display_name=filename or Path(file_path).name,
+            force_class=force_class,
+            user_id=user_id,
+            tenant_id=tenant_id,
+            acl_groups=acl_groups,
+        )
 
+    async def ingest_bytes(
+        self,
+        content: bytes,
+        filename: str,
+        force_class: Optional[DataClass] = None,
+        user_id: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        acl_groups: Optional[List[str]] = None,
+    ) -> Tuple[List[Chunk], ClassificationResult]:
+        """
+        Ingest from raw bytes (file upload).
+
+        Content is handed to the engine in memory; only engines that
+        need a real path spool it to a (tmpfs-backed) temp file.
+        Classification (sensitivity, categories, frameworks) uses the
+        uploaded *filename*, never a temp-file name.
+        """
+        return await self._ingest(
+            file_path=filename,
+            display_name=filename,
+            content=content,
+            force_class=force_class,
+            user_id=user_id,
+            tenant_id=tenant_id,
+            acl_groups=acl_groups,
+        )
+
+    async def _ingest(
+        self,
+        file_path: str,
+        display_name: str,
+        content: Optional[bytes] = None,
+        force_class: Optional[DataClass] = None,
+        user_id: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        acl_groups: Optional[List[str]] = None,
+    ) -> Tuple[List[Chunk], ClassificationResult]:
         # Classify
         classification = self.classify(file_path)
         if force_class:
@@ -221,22 +329,29 @@ class DocumentIngestionRouter:
 
         # Extract via engine
         chunks = await self._execute_engine(
-            file_path, display_name, classification.data_class
+            file_path, display_name, classification.data_class, content
         )
 
-        # Enrich metadata
+        # Enrich metadata (document-level values resolved once, not per chunk)
+        data_class_value = classification.data_class.value
+        sensitivity_value = classification.sensitivity_level.value
+        category_values = [c.value for c in classification.data_categories]
+        decay_rate = classification.decay_rate
+        frameworks = classification.compliance_frameworks
+        acl_groups = acl_groups or []
         for chunk in chunks:
-            chunk.metadata.provenance_id = provenance_id
-            chunk.metadata.data_class = classification.data_class.value
-            chunk.metadata.source_file = display_name
-            chunk.metadata.ingested_at = now
-            chunk.metadata.decay_rate = classification.decay_rate
-            chunk.metadata.sensitivity_level = classification.sensitivity_level.value
-            chunk.metadata.data_categories = [c.value for c in classification.data_categories]
-            chunk.metadata.user_id = user_id
-            chunk.metadata.tenant_id = tenant_id
-            chunk.metadata.acl_groups = acl_groups or []
-            chunk.metadata.compliance_frameworks = classification.compliance_frameworks
+            metadata = chunk.metadata
+            metadata.provenance_id = provenance_id
+            metadata.data_class = data_class_value
+            metadata.source_file = display_name
+            metadata.ingested_at = now
+            metadata.decay_rate = decay_rate
+            metadata.sensitivity_level = sensitivity_value
+            metadata.data_categories = category_values
+            metadata.user_id = user_id
+            metadata.tenant_id = tenant_id
+            metadata.acl_groups = acl_groups
+            metadata.compliance_frameworks = frameworks
 
         logger.info(
             "Ingestion complete",
@@ -247,67 +362,48 @@ class DocumentIngestionRouter:
 
         return chunks, classification
 
-    async def ingest_bytes(
+    async def _execute_engine(
         self,
-        content: bytes,
+        file_path: str,
         filename: str,
-        force_class: Optional[DataClass] = None,
-        user_id: Optional[str] = None,
-        tenant_id: Optional[str] = None,
-        acl_groups: Optional[List[str]] = None,
-    ) -> Tuple[List[Chunk], ClassificationResult]:
-        """Ingest from raw bytes (file upload). Writes to temp file."""
-        import tempfile
-
-        ext = Path(filename).suffix
-        with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
-
-        try:
-            return await self.ingest(
-                file_path=tmp_path,
-                filename=filename,
-                force_class=force_class,
-                user_id=user_id,
-                tenant_id=tenant_id,
-                acl_groups=acl_groups,
-            )
-        finally:
-            try:
-                Path(tmp_path).unlink()
-            except Exception:
-                pass
-
-    async def _execute_engine(
-        self, file_path: str, filename: str, data_class: DataClass
+        data_class: DataClass,
+        content: Optional[bytes] = None,
     ) -> List[Chunk]:
         """Route to the correct extraction engine."""
-        engine = self._engines.get(data_class)
-
         if data_class == DataClass.CLASS_A_TRUTH and not self.docling_enabled:
             if self.fallback_to_unstructured:
                 logger.warning("Docling disabled, falling back to Unstructured")
-                engine = self._engines[DataClass.CLASS_B_CHATTER]
+                engine = self._get_engine(DataClass.CLASS_B_CHATTER)
             else:
                 raise RuntimeError("Docling is disabled and fallback is off")
+        else:
+            engine = self._get_engine(data_class)
 
         if engine is None:
             raise ValueError(f"No engine for class: {data_class}")
 
         try:
-            return await engine.extract(file_path)
+            return await self._run_engine(engine, file_path, filename, content)
         except Exception as e:
             if (
                 data_class == DataClass.CLASS_A_TRUTH
                 and self.fallback_to_unstructured
             ):
                 logger.warning("Engine failed, falling back", error=str(e))
-                return await self._engines[DataClass.CLASS_B_CHATTER].extract(
-                    file_path
+                return await self._run_engine(
+                    self._get_engine(DataClass.CLASS_B_CHATTER),
+                    file_path, filename, content,
                 )
             raise
 
+    @staticmethod
+    async def _run_engine(
+        engine, file_path: str, filename: str, content: Optional[bytes]
+    ) -> List[Chunk]:
+        if content is not None:
+            return await engine.extract_bytes(content, filename)
+        return await engine.extract(file_path)
+
 
 # ---------------------------------------------------------------------------
 # Singleton
@@ -10,7 +10,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ---------------------------------------------------------------------------
@@ -80,6 +80,10 @@ class ConnectorCategory(str, Enum):
 # ---------------------------------------------------------------------------
 class ChunkMetadata(BaseModel):
     """Metadata attached to every extracted chunk."""
+    # Hot path: ingest() enriches every chunk field by field — keep
+    # attribute assignment unvalidated.
+    model_config = ConfigDict(validate_assignment=False)
+
     provenance_id: str = ""
     data_class: str = ""
     source_file: str = ""
@@ -105,6 +109,8 @@ class ChunkMetadata(BaseModel):
 
 class Chunk(BaseModel):
     """A single extracted chunk of content."""
+    model_config = ConfigDict(validate_assignment=False)
+
     text: str
     metadata: ChunkMetadata = Field(default_factory=ChunkMetadata)
     embedding: Optional[List[float]] = None
@@ -7,7 +7,9 @@ Reciprocal Rank Fusion (RRF).
 NIST AI RMF: MEASURE 2.1 — Search quality is auditable.
 """
 
+import heapq
 import uuid
+import numpy as np
 import structlog
 from typing import List, Optional
 
@@ -56,10 +58,11 @@ class TriSearchEngine:
             graph_results = await self._graph_search(query, tenant_id, limit)
 
         if mode == SearchMode.TRISEARCH:
-            fused = self._reciprocal_rank_fusion(
-                [keyword_results, vector_results, graph_results], k=k
+            results = self._reciprocal_rank_fusion(
+                [keyword_results, vector_results, graph_results],
+                k=k,
+                limit=limit,
             )
-            results = fused[:limit]
         elif mode == SearchMode.KEYWORD:
             results = keyword_results
         elif mode == SearchMode.VECTOR:
@@ -85,12 +88,14 @@ class TriSearchEngine:
     ) -> List[SearchResult]:
         tenant_filter = "AND c.tenant_id = :tenant_id" if tenant_id else ""
         sql = text(f"""
-            SELECT c.id, c.text, c.data_class, c.provenance_id,
+            WITH q AS (SELECT plainto_tsquery('english', :query) AS tsq)
+            SELECT c.id, LEFT(c.text, 500) AS text, c.data_class, c.provenance_id,
                    d.filename AS source_file,
-                   ts_rank(c.search_vector, plainto_tsquery('english', :query)) AS score
+                   ts_rank(c.search_vector, q.tsq) AS score
             FROM chunks c
             JOIN documents d ON c.document_id = d.id
-            WHERE c.search_vector @@ plainto_tsquery('english', :query)
+            CROSS JOIN q
+            WHERE c.search_vector @@ q.tsq
             {tenant_filter}
             ORDER BY score DESC
             LIMIT :limit
@@ -105,7 +110,7 @@ class TriSearchEngine:
         return [
             SearchResult(
                 chunk_id=r.id,
-                text=r.text[:500],
+                text=r.text,
                 score=float(r.score),
                 source_file=r.source_file,
                 data_class=r.data_class,
@@ -127,17 +132,22 @@ class TriSearchEngine:
 
         tenant_filter = "AND c.tenant_id = :tenant_id" if tenant_id else ""
         sql = text(f"""
-            SELECT c.id, c.text, c.data_class, c.provenance_id,
+            SELECT c.id, LEFT(c.text, 500) AS text, c.data_class, c.provenance_id,
                    d.filename AS source_file,
-                   1 - (c.embedding <=> :embedding::vector) AS score
+                   1 - (c.embedding <=> CAST(:embedding AS vector)) AS score
             FROM chunks c
             JOIN documents d ON c.document_id = d.id
             WHERE c.embedding IS NOT NULL
             {tenant_filter}
-            ORDER BY c.embedding <=> :embedding::vector
+            ORDER BY c.embedding <=> CAST(:embedding AS vector)
             LIMIT :limit
         """)
-        params = {"embedding": str(embedding), "limit": limit}
+        # Bound as float32 and sent in pgvector's binary format
+        # (see app.db.session) rather than as a formatted text literal.
+        params = {
+            "embedding": np.asarray(embedding, dtype=np.float32),
+            "limit": limit,
+        }
         if tenant_id:
             params["tenant_id"] = tenant_id
 
@@ -147,7 +157,7 @@ class TriSearchEngine:
         return [
             SearchResult(
                 chunk_id=r.id,
-                text=r.text[:500],
+                text=r.text,
                 score=float(r.score),
                 source_file=r.source_file,
                 data_class=r.data_class,
@@ -186,7 +196,7 @@ class TriSearchEngine:
                     CASE WHEN ge.source_id = mn.id THEN ge.target_id ELSE ge.source_id END
                 )
             )
-            SELECT c.id, c.text, c.data_class, c.provenance_id,
+            SELECT c.id, LEFT(c.text, 500) AS text, c.data_class, c.provenance_id,
                    d.filename AS source_file,
                    0.7 AS score
             FROM chunks c
@@ -208,7 +218,7 @@ class TriSearchEngine:
         return [
             SearchResult(
                 chunk_id=r.id,
-                text=r.text[:500],
+                text=r.text,
                 score=float(r.score),
                 source_file=r.source_file,
                 data_class=r.data_class,
@@ -221,13 +231,28 @@ class TriSearchEngine:
     # Reciprocal Rank Fusion
     # -----------------------------------------------------------------
     def _reciprocal_rank_fusion(
-        self, result_lists: List[List[SearchResult]], k: int = 60
+        self,
+        result_lists: List[List[SearchResult]],
+        k: int = 60,
+        limit: int = 20,
     ) -> List[SearchResult]:
-        """Fuse multiple ranked lists using RRF."""
+        """Fuse multiple ranked lists using RRF, keeping the top `limit`."""
+        non_empty = [results for results in result_lists if results]
+        if not non_empty:
+            return []
+        if len(non_empty) == 1:
+            # Degraded case (e.g. no embeddings / empty graph): nothing to
+            # merge, so keep the list order and just assign RRF scores.
+            fused = non_empty[0][:limit]
+            for rank, r in enumerate(fused, start=1):
+                r.score = 1.0 / (k + rank)
+                r.search_mode = "trisearch"
+            return fused
+
         scores: dict[str, float] = {}
         best_result: dict[str, SearchResult] = {}
 
-        for results in result_lists:
+        for results in non_empty:
             for rank, r in enumerate(results, start=1):
                 rrf_score = 1.0 / (k + rank)
                 scores[r.chunk_id] = scores.get(r.chunk_id, 0.0) + rrf_score
@@ -235,7 +260,10 @@ class TriSearchEngine:
                     best_result[r.chunk_id] = r
 
         fused = []
-        for chunk_id, score in sorted(scores.items(), key=lambda x: -x[1]):
+        # Partial selection: O(N log limit) instead of a full sort
+        for chunk_id, score in heapq.nlargest(
+            limit, scores.items(), key=lambda x: x[1]
+        ):
             r = best_result[chunk_id]
             r.score = score
             r.search_mode = "trisearch"
@@ -10,11 +10,28 @@ graph edges, and connectors.
 NIST AI RMF: MANAGE 2.3 — Departmental/Project Isolation
 """
 
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 
-from sqlalchemy import and_, or_
+from sqlalchemy import String, and_, bindparam, or_
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import NoInspectionAvailable
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from app.core.security_context import SecurityContext, Role
+from app.core.security_context import SYSTEM_RESOURCE_ROLES, SecurityContext, Role
+
+
+# Owner id of programmatically ingested (system) resources
+SYSTEM_USER_ID = "system"
+
+
+class ResourceACL(NamedTuple):
+    """Access-relevant fields of one resource (hashable, for memoizing)."""
+    tenant_id: str
+    user_id: str
+    access_level: str = "team"
+    project_id: Optional[str] = None
+    acl_groups: tuple[str, ...] = ()
 
 
 class ResourceAccessPolicy:
@@ -35,7 +52,7 @@ class ResourceAccessPolicy:
     """
 
     # Roles that can access system-ingested resources (user_id="system")
-    SYSTEM_RESOURCE_ROLES = [Role.ADMIN, Role.ANALYST, Role.PM]
+    SYSTEM_RESOURCE_ROLES = list(SYSTEM_RESOURCE_ROLES)
 
     # Roles that can access any user's resources within their tenant
     TENANT_ADMIN_ROLES = [Role.ADMIN]
@@ -68,7 +85,7 @@ class ResourceAccessPolicy:
             return False
 
         # Admin override within tenant
-        if Role.ADMIN in ctx.roles:
+        if ctx.is_admin:
             return True
 
         # Owner always has access to their own resources
@@ -76,30 +93,77 @@ class ResourceAccessPolicy:
             return True
 
         # System resources (user_id="system") follow role-based access
-        if resource_user_id == "system":
+        if resource_user_id == SYSTEM_USER_ID:
             return cls.can_access_system_resources(ctx)
 
         # Check access_level hierarchy
-        if resource_access_level == "private":
-            return False  # Only owner (checked above)
-
-        if resource_access_level == "team":
-            if resource_acl_groups:
-                return bool(set(ctx.groups) & set(resource_acl_groups))
+        handler = cls._LEVEL_DISPATCH.get(resource_access_level)
+        if handler is None:
             return False
+        return handler(ctx, resource_project_id, resource_acl_groups)
 
-        if resource_access_level == "project":
-            return (
-                ctx.project_id is not None
-                and resource_project_id is not None
-                and ctx.project_id == resource_project_id
-            )
-
-        if resource_access_level == "tenant":
-            return True  # Same tenant already verified above
+    @classmethod
+    def can_access_acl(cls, ctx: SecurityContext, acl: ResourceACL) -> bool:
+        """can_access() for a prebuilt ResourceACL."""
+        return cls.can_access(
+            ctx,
+            resource_tenant_id=acl.tenant_id,
+            resource_user_id=acl.user_id,
+            resource_access_level=acl.access_level,
+            resource_project_id=acl.project_id,
+            resource_acl_groups=acl.acl_groups,
+        )
+
+    # -----------------------------------------------------------------
+    # Access-level handlers (tenant and owner already checked)
+    # -----------------------------------------------------------------
+    @staticmethod
+    def _check_private(
+        ctx: SecurityContext,
+        resource_project_id: Optional[str],
+        resource_acl_groups: Optional[list[str]],
+    ) -> bool:
+        return False  # Only owner (checked in can_access)
 
+    @staticmethod
+    def _check_team(
+        ctx: SecurityContext,
+        resource_project_id: Optional[str],
+        resource_acl_groups: Optional[list[str]],
+    ) -> bool:
+        if resource_acl_groups:
+            # Probes each ACL entry against ctx.groups (a frozenset) and
+            # stops at the first hit — no temporary sets.
+            return not ctx.groups.isdisjoint(resource_acl_groups)
         return False
 
+    @staticmethod
+    def _check_project(
+        ctx: SecurityContext,
+        resource_project_id: Optional[str],
+        resource_acl_groups: Optional[list[str]],
+    ) -> bool:
+        return (
+            ctx.project_id is not None
+            and resource_project_id is not None
+            and ctx.project_id == resource_project_id
+        )
+
+    @staticmethod
+    def _check_tenant(
+        ctx: SecurityContext,
+        resource_project_id: Optional[str],
+        resource_acl_groups: Optional[list[str]],
+    ) -> bool:
+        return True  # Same tenant already verified
+
+    _LEVEL_DISPATCH = {
+        "private": _check_private,
+        "team": _check_team,
+        "project": _check_project,
+        "tenant": _check_tenant,
+    }
+
     @classmethod
     def can_access_system_resources(cls, ctx: SecurityContext) -> bool:
         """
@@ -108,7 +172,7 @@ class ResourceAccessPolicy:
         System resources (user_id="system") are typically documentation
         or organizational knowledge ingested programmatically.
         """
-        return any(role in cls.SYSTEM_RESOURCE_ROLES for role in ctx.roles)
+        return ctx.can_view_system
 
     @classmethod
     def build_query_filter(cls, ctx: SecurityContext, query: Any, model: Any) -> Any:
@@ -129,47 +193,24 @@ class ResourceAccessPolicy:
         Returns:
             Filtered query
         """
-        # MANDATORY: Tenant isolation
-        query = query.where(model.tenant_id == ctx.tenant_id)
-
-        # Admin sees everything within their tenant
-        if Role.ADMIN in ctx.roles:
-            return query
-
-        # Non-admin: apply access level rules
-        if hasattr(model, "access_level") and hasattr(model, "user_id"):
-            conditions = [
-                # Always see own resources
-                model.user_id == ctx.user_id,
-                # Tenant-wide resources
-                model.access_level == "tenant",
-                # System resources for authorized roles
-            ]
-
-            if cls.can_access_system_resources(ctx):
-                conditions.append(model.user_id == "system")
-
-            # Project scoping
-            if ctx.project_id and hasattr(model, "project_id"):
-                conditions.append(
-                    and_(
-                        model.access_level == "project",
-                        model.project_id == ctx.project_id,
-                    )
-                )
-
-            # Team/group scoping
-            if ctx.groups and hasattr(model, "acl_groups"):
-                conditions.append(
-                    and_(
-                        model.access_level == "team",
-                        model.acl_groups.overlap(ctx.groups),
-                    )
-                )
-
-            query = query.where(or_(*conditions))
-
-        return query
+        # Admins, and models without per-row access columns, are filtered
+        # by tenant alone — one clause per (model, tenant), shared by users.
+        caps = _model_caps(model)
+        if ctx.is_admin or not (caps & _HAS_ACCESS_LEVEL and caps & _HAS_USER_ID):
+            return query.where(_tenant_clause(model, ctx.tenant_id))
+
+        # The clause depends only on the model and the context's identity,
+        # so it is built once per (model, user) and reused across queries.
+        return query.where(
+            _build_access_clause(
+                model,
+                ctx.tenant_id,
+                ctx.user_id,
+                ctx.project_id,
+                ctx.groups,
+                cls.can_access_system_resources(ctx),
+            )
+        )
 
     @classmethod
     def filter_accessible_resources(
@@ -183,28 +224,181 @@ class ResourceAccessPolicy:
         Use build_query_filter() for SQL-level filtering when possible.
         This is a fallback for non-SQL scenarios (e.g., graph traversals).
         """
+        if ctx.is_admin:
+            # Admins see every resource in their tenant — one compare per row
+            tenant_id = ctx.tenant_id
+            legacy_owners = (ctx.user_id, SYSTEM_USER_ID)
+            return [
+                resource for resource in resources
+                if (
+                    resource_tenant_id == tenant_id
+                    if (resource_tenant_id := resource.get("tenant_id", ""))
+                    else resource.get("user_id", "") in legacy_owners
+                )
+            ]
+
         accessible = []
+        # Most resources share tenant / access_level, so the decision for
+        # a (tenant_id, access_level, is_system) bucket is made once and
+        # only undecided buckets fall through to the per-row check.
+        bucket_verdicts: dict[tuple, Optional[bool]] = {}
+        # Rows left undecided by their bucket repeat the same attribute
+        # tuples too (one owner, one project, a few ACL sets); remember
+        # each full decision for the rest of this call.
+        row_verdicts: dict[ResourceACL, bool] = {}
+        # Loop invariants bound to locals: this loop runs once per row of
+        # graph traversals that return thousands of resources.
+        user_id = ctx.user_id
+        append = accessible.append
         for resource in resources:
             resource_user_id = resource.get("user_id", "")
             resource_tenant_id = resource.get("tenant_id", "")
             resource_access_level = resource.get("access_level", "team")
-            resource_project_id = resource.get("project_id")
-            resource_acl_groups = resource.get("acl_groups", [])
 
             if not resource_tenant_id:
                 # Legacy resource without tenant — allow if owner or system
-                if resource_user_id == ctx.user_id or resource_user_id == "system":
-                    accessible.append(resource)
+                if resource_user_id == user_id or resource_user_id == SYSTEM_USER_ID:
+                    append(resource)
                 continue
 
-            if cls.can_access(
-                ctx,
-                resource_tenant_id=resource_tenant_id,
-                resource_user_id=resource_user_id,
-                resource_access_level=resource_access_level,
-                resource_project_id=resource_project_id,
-                resource_acl_groups=resource_acl_groups,
-            ):
-                accessible.append(resource)
+            key = (resource_tenant_id, resource_access_level, resource_user_id == SYSTEM_USER_ID)
+            verdict = bucket_verdicts.get(key, _UNDECIDED)
+            if verdict is _UNDECIDED:
+                verdict = bucket_verdicts[key] = cls._bucket_verdict(ctx, *key)
+
+            if verdict is None:
+                resource_acl_groups = resource.get("acl_groups")
+                acl = ResourceACL(
+                    resource_tenant_id,
+                    resource_user_id,
+                    resource_access_level,
+                    resource.get("project_id"),
+                    tuple(resource_acl_groups) if resource_acl_groups else (),
+                )
+                verdict = row_verdicts.get(acl)
+                if verdict is None:
+                    verdict = row_verdicts[acl] = cls.can_access_acl(ctx, acl)
+
+            if verdict:
+                append(resource)
 
         return accessible
+
+    @classmethod
+    def _bucket_verdict(
+        cls,
+        ctx: SecurityContext,
+        resource_tenant_id: str,
+        resource_access_level: str,
+        is_system: bool,
+    ) -> Optional[bool]:
+        """
+        Decide a whole bucket of resources at once, mirroring can_access().
+
+        Returns True/False when every resource in the bucket gets the same
+        answer, or None when per-resource fields (owner, project, ACL
+        groups) must be checked.
+        """
+        if ctx.tenant_id != resource_tenant_id:
+            return False
+        if ctx.is_admin:
+            return True
+        if is_system:
+            return ctx.user_id == SYSTEM_USER_ID or cls.can_access_system_resources(ctx)
+        if resource_access_level == "tenant":
+            return True
+        return None
+
+
+# Sentinel for bucket_verdicts misses (None is a stored "undecided" verdict)
+_UNDECIDED = object()
+
+# Per-model column capabilities, resolved once per ORM class
+_HAS_ACCESS_LEVEL = 1
+_HAS_USER_ID = 2
+_HAS_PROJECT_ID = 4
+_HAS_ACL_GROUPS = 8
+
+_CAPABILITY_COLUMNS = (
+    ("access_level", _HAS_ACCESS_LEVEL),
+    ("user_id", _HAS_USER_ID),
+    ("project_id", _HAS_PROJECT_ID),
+    ("acl_groups", _HAS_ACL_GROUPS),
+)
+
+_MODEL_CAPS: dict[Any, int] = {}
+
+
+def _model_caps(model: Any) -> int:
+    """Bitmask of the access-control columns *model* defines."""
+    caps = _MODEL_CAPS.get(model)
+    if caps is None:
+        try:
+            columns = sa_inspect(model).columns.keys()
+        except (NoInspectionAvailable, AttributeError):
+            # Not a mapped class (e.g. an aliased or ad-hoc selectable)
+            columns = [name for name, _ in _CAPABILITY_COLUMNS if hasattr(model, name)]
+        caps = 0
+        for name, flag in _CAPABILITY_COLUMNS:
+            if name in columns:
+                caps |= flag
+        _MODEL_CAPS[model] = caps
+    return caps
+
+
+@lru_cache(maxsize=256)
+def _tenant_clause(model: Any, tenant_id: str) -> Any:
+    """MANDATORY tenant isolation clause (memoized)."""
+    return model.tenant_id == tenant_id
+
+
+@lru_cache(maxsize=4096)
+def _build_access_clause(
+    model: Any,
+    tenant_id: str,
+    user_id: str,
+    project_id: Optional[str],
+    groups: frozenset[str],
+    can_view_system: bool,
+) -> Any:
+    """
+    Build (and memoize) the non-admin WHERE clause for build_query_filter().
+
+    *model* must define access_level and user_id; callers route everything
+    else to _tenant_clause().
+    """
+    caps = _model_caps(model)
+    conditions = [
+        # Always see own resources
+        model.user_id == user_id,
+        # Tenant-wide resources
+        model.access_level == "tenant",
+    ]
+
+    # System resources for authorized roles
+    if can_view_system:
+        conditions.append(model.user_id == SYSTEM_USER_ID)
+
+    # Project scoping
+    if project_id and caps & _HAS_PROJECT_ID:
+        conditions.append(
+            and_(
+                model.access_level == "project",
+                model.project_id == project_id,
+            )
+        )
+
+    # Team/group scoping — the groups travel as ONE array parameter
+    # ("acl_groups && $n::VARCHAR[]"), so the statement text does not
+    # change with group count and asyncpg's prepared-statement cache hits.
+    if groups and caps & _HAS_ACL_GROUPS:
+        conditions.append(
+            and_(
+                model.access_level == "team",
+                model.acl_groups.overlap(
+                    bindparam("acl_groups", sorted(groups), type_=ARRAY(String), unique=True)
+                ),
+            )
+        )
+
+    return and_(_tenant_clause(model, tenant_id), or_(*conditions))
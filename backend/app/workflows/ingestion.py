@@ -7,14 +7,55 @@ progress tracking, and failure recovery.
 NIST AI RMF: GOVERN 1.1 — Workflow orchestration is auditable.
 """
 
+import asyncio
 import structlog
 from datetime import timedelta
+from types import MappingProxyType
 
 from temporalio import workflow, activity
 from temporalio.common import RetryPolicy
 
 logger = structlog.get_logger()
 
+# Inputs per embeddings request (Azure OpenAI accepts a list of inputs)
+EMBEDDING_BATCH_SIZE = 32
+
+# Shared read-only default for chunks without metadata
+_EMPTY_METADATA = MappingProxyType({})
+
+# Azure OpenAI client shared across activity invocations (see _get_openai_client)
+_openai_client = None
+
+# Process pool for CPU-bound extraction (see _get_extraction_pool)
+_extraction_pool = None
+
+
+# ---------------------------------------------------------------------------
+# Chunk store
+# ---------------------------------------------------------------------------
+# Embedded chunks (text + 1536 floats each) are too large to pass between
+# activities: every argument is serialized into Temporal's event history.
+# They are spooled once to the upload volume shared by the API and workers,
+# and downstream activities receive only the key.
+def _save_chunks(document_id: str, chunks: list) -> str:
+    """Write chunks to the shared store and return their key (blocking)."""
+    import json
+    from pathlib import Path
+    from app.config import settings
+
+    path = Path(settings.upload_dir) / "chunks" / f"{document_id}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(chunks), encoding="utf-8")
+    return str(path)
+
+
+def _load_chunks(chunks_key: str) -> list:
+    """Read chunks saved by _save_chunks() (blocking)."""
+    import json
+    from pathlib import Path
+
+    return json.loads(Path(chunks_key).read_text(encoding="utf-8"))
+
 
 # ---------------------------------------------------------------------------
 # Activities
@@ -34,57 +75,123 @@ async def classify_document_activity(file_path: str, filename: str) -> dict:
     }
 
 
-@activity.defn
-async def extract_chunks_activity(
-    file_path: str, filename: str, data_class: str
-) -> list:
-    """Extract chunks from a document."""
+def _get_extraction_pool():
+    """Lazily start the extraction process pool (one per worker process)."""
+    global _extraction_pool
+    if _extraction_pool is None:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from app.config import settings
+
+        # "spawn", not the Linux default "fork": the worker already runs the
+        # Temporal SDK's native threads, and forking a threaded process can
+        # deadlock the child.
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=settings.extraction_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _extraction_pool
+
+
+def _extract_chunks(file_path: str, filename: str, data_class: str) -> list:
+    """Parse a document in an extraction process (blocking)."""
     from app.router.classifier import get_router
     from app.router.models import DataClass
 
     router = get_router()
-    dc = DataClass(data_class)
-    chunks, _ = await router.ingest(file_path, filename, force_class=dc)
+    chunks, _ = router.ingest_sync(file_path, filename, force_class=DataClass(data_class))
     return [{"text": c.text, "metadata": c.metadata.model_dump()} for c in chunks]
 
 
 @activity.defn
-async def generate_embeddings_activity(chunks: list) -> list:
-    """Generate embeddings for a batch of chunks."""
-    from app.config import settings
+async def extract_chunks_activity(
+    file_path: str, filename: str, data_class: str
+) -> list:
+    """
+    Extract chunks from a document.
 
-    if not settings.azure_openai_endpoint:
-        return chunks
+    Parsing is CPU-bound, so it runs in the extraction process pool and
+    leaves the worker's event loop free for the I/O-bound activities.
+    """
+    from concurrent.futures.process import BrokenProcessPool
 
+    global _extraction_pool
+    loop = asyncio.get_running_loop()
     try:
+        return await loop.run_in_executor(
+            _get_extraction_pool(), _extract_chunks, file_path, filename, data_class
+        )
+    except BrokenProcessPool:
+        # A child died (e.g. OOM in the parser) and the pool is unusable;
+        # drop it so Temporal's retry starts a fresh one
+        logger.error("Extraction pool broken, restarting", filename=filename)
+        _extraction_pool = None
+        raise
+
+
+@activity.defn
+async def generate_embeddings_activity(chunks: list, document_id: str) -> dict:
+    """
+    Generate embeddings for a batch of chunks.
+
+    Returns a handle ({"chunks_key", "count"}) to the embedded chunks in
+    the shared chunk store rather than the chunks themselves.
+    """
+    from app.config import settings
+
+    if settings.azure_openai_endpoint:
+        await _embed_chunks(chunks, settings)
+
+    chunks_key = await asyncio.to_thread(_save_chunks, document_id, chunks)
+    return {"chunks_key": chunks_key, "count": len(chunks)}
+
+
+def _get_openai_client(settings):
+    """Lazily create the shared client so its connection pool is reused."""
+    global _openai_client
+    if _openai_client is None:
         from openai import AsyncAzureOpenAI
 
-        client = AsyncAzureOpenAI(
+        _openai_client = AsyncAzureOpenAI(
             azure_endpoint=settings.azure_openai_endpoint,
             api_key=settings.azure_openai_api_key,
             api_version="2024-02-01",
         )
+    return _openai_client
+
 
-        for chunk in chunks:
+async def _embed_chunks(chunks: list, settings) -> None:
+    import openai
+
+    global _openai_client
+    try:
+        client = _get_openai_client(settings)
+
+        for start in range(0, len(chunks), EMBEDDING_BATCH_SIZE):
+            batch = chunks[start:start + EMBEDDING_BATCH_SIZE]
             resp = await client.embeddings.create(
-                input=chunk["text"][:8191],
+                input=[c["text"][:8191] for c in batch],
                 model=settings.azure_openai_embedding_deployment,
             )
-            chunk["embedding"] = resp.data[0].embedding
+            for item in resp.data:
+                batch[item.index]["embedding"] = item.embedding
 
     except Exception as e:
+        if isinstance(e, openai.AuthenticationError):
+            # Drop the cached client so rotated credentials are picked up
+            _openai_client = None
         logger.error("Embedding batch failed", error=str(e))
 
-    return chunks
-
 
 @activity.defn
-async def build_graph_activity(chunks: list, document_id: str, tenant_id: str) -> dict:
+async def build_graph_activity(chunks_key: str, document_id: str, tenant_id: str) -> dict:
     """Build knowledge graph from extracted chunks."""
     from app.db.session import async_session
     from app.graph.knowledge import KnowledgeGraphBuilder
     from app.router.models import Chunk, ChunkMetadata
 
+    chunks = await asyncio.to_thread(_load_chunks, chunks_key)
+
     chunk_objects = [
         Chunk(text=c["text"], metadata=ChunkMetadata(**c.get("metadata", {})))
         for c in chunks
@@ -100,31 +207,48 @@ async def build_graph_activity(chunks: list, document_id: str, tenant_id: str) -
 
 @activity.defn
 async def persist_chunks_activity(
-    chunks: list, document_id: str, data_class: str, tenant_id: str
+    chunks_key: str, document_id: str, data_class: str, tenant_id: str
 ) -> int:
     """Persist chunks to PostgreSQL."""
+    from sqlalchemy import insert
+
     from app.db.session import async_session
     from app.db.models import ChunkRecord
 
+    chunks = await asyncio.to_thread(_load_chunks, chunks_key)
+
+    rows = []
+    for i, chunk in enumerate(chunks):
+        metadata = chunk.get("metadata") or _EMPTY_METADATA
+        rows.append({
+            "id": f"{document_id}-{i:04d}",
+            "document_id": document_id,
+            "text": chunk["text"],
+            "embedding": chunk.get("embedding"),
+            "element_type": metadata.get("element_type"),
+            "page": metadata.get("page"),
+            "data_class": data_class,
+            "decay_rate": metadata.get("decay_rate", 0.5),
+            "tenant_id": tenant_id,
+        })
+
     async with async_session() as db:
-        for i, chunk in enumerate(chunks):
-            record = ChunkRecord(
-                id=f"{document_id}-{i:04d}",
-                document_id=document_id,
-                text=chunk["text"],
-                embedding=chunk.get("embedding"),
-                element_type=chunk.get("metadata", {}).get("element_type"),
-                page=chunk.get("metadata", {}).get("page"),
-                data_class=data_class,
-                decay_rate=chunk.get("metadata", {}).get("decay_rate", 0.5),
-                tenant_id=tenant_id,
-            )
-            db.add(record)
+        # One executemany INSERT — no per-row ORM unit-of-work bookkeeping
+        if rows:
+            await db.execute(insert(ChunkRecord), rows)
         await db.commit()
 
     return len(chunks)
 
 
+@activity.defn
+async def discard_chunks_activity(chunks_key: str) -> None:
+    """Remove spooled chunks once every consumer has finished."""
+    from pathlib import Path
+
+    await asyncio.to_thread(Path(chunks_key).unlink, missing_ok=True)
+
+
 # ---------------------------------------------------------------------------
 # Workflow
 # ---------------------------------------------------------------------------
@@ -137,8 +261,8 @@ class IngestionWorkflow:
     1. Classify document
     2. Extract chunks
     3. Generate embeddings
-    4. Build knowledge graph
-    5. Persist to database
+    4. Build knowledge graph  ┐ concurrent
+    5. Persist to database    ┘
     """
 
     @workflow.run
@@ -171,29 +295,41 @@ class IngestionWorkflow:
             retry_policy=retry_policy,
         )
 
-        # 3. Embed
-        chunks = await workflow.execute_activity(
+        # 3. Embed (result is a handle into the chunk store)
+        embedded = await workflow.execute_activity(
             generate_embeddings_activity,
-            args=[chunks],
+            args=[chunks, document_id],
             start_to_close_timeout=timedelta(minutes=30),
             retry_policy=retry_policy,
         )
-
-        # 4. Graph
-        graph_result = await workflow.execute_activity(
-            build_graph_activity,
-            args=[chunks, document_id, tenant_id],
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=retry_policy,
-        )
-
-        # 5. Persist
-        chunk_count = await workflow.execute_activity(
-            persist_chunks_activity,
-            args=[chunks, document_id, classification["data_class"], tenant_id],
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=retry_policy,
-        )
+        chunks_key = embedded["chunks_key"]
+
+        # 4. Graph + 5. Persist — independent consumers of the chunks,
+        # so they run concurrently
+        try:
+            graph_result, chunk_count = await asyncio.gather(
+                workflow.execute_activity(
+                    build_graph_activity,
+                    args=[chunks_key, document_id, tenant_id],
+                    start_to_close_timeout=timedelta(minutes=5),
+                    retry_policy=retry_policy,
+                ),
+                workflow.execute_activity(
+                    persist_chunks_activity,
+                    args=[chunks_key, document_id, classification["data_class"], tenant_id],
+                    start_to_close_timeout=timedelta(minutes=5),
+                    retry_policy=retry_policy,
+                ),
+            )
+        finally:
+            # The spooled file holds full text and embeddings — remove it
+            # on failure and cancellation too, not only on success
+            await workflow.execute_activity(
+                discard_chunks_activity,
+                args=[chunks_key],
+                start_to_close_timeout=timedelta(minutes=1),
+                retry_policy=retry_policy,
+            )
 
         return {
             "document_id": document_id,
@@ -15,6 +15,7 @@ from app.workflows.ingestion import (
     generate_embeddings_activity,
     build_graph_activity,
     persist_chunks_activity,
+    discard_chunks_activity,
 )
 
 logger = structlog.get_logger()
@@ -37,7 +38,9 @@ async def main():
             generate_embeddings_activity,
             build_graph_activity,
             persist_chunks_activity,
+            discard_chunks_activity,
         ],
+        max_concurrent_activities=settings.temporal_max_concurrent_activities,
     )
 
     logger.info("Worker running", task_queue=TASK_QUEUE)
@@ -0,0 +1,54 @@
+"""
+Classifier Tests
+=================
+Verifies that governance classification follows the document's real name.
+
+Tests:
+1. Upload Classification: ingest_bytes() classifies by the uploaded filename.
+2. Cache Isolation: Mutating a returned result never changes later results.
+"""
+
+import asyncio
+
+import pytest
+
+from app.router.classifier import DocumentIngestionRouter
+from app.router.models import DataCategory
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def router():
+    router = DocumentIngestionRouter()
+
+    async def no_extraction(file_path, filename, data_class, content=None):
+        return []
+
+    # Classification only — keep the extraction engines out of the test
+    router._execute_engine = no_extraction
+    return router
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_upload_classified_by_filename(router):
+    """Ensure uploads get the sensitivity of their real name, not a temp name."""
+    _, classification = asyncio.run(
+        router.ingest_bytes(b"%PDF-1.7", "hipaa_manual.pdf", user_id="user-a")
+    )
+    assert DataCategory.PHI in classification.data_categories
+    assert "HIPAA" in classification.compliance_frameworks
+
+
+def test_classification_cache_isolated(router):
+    """Ensure in-place edits to a result do not leak into the memo cache."""
+    first = router.classify("hipaa_manual.pdf")
+    first.data_categories.append(DataCategory.CUI)
+    first.compliance_frameworks.clear()
+
+    again = router.classify("hipaa_manual.pdf")
+    assert again.data_categories == [DataCategory.PHI]
+    assert again.compliance_frameworks == ["HIPAA"]
@@ -0,0 +1,46 @@
+"""
+Extraction Engine Tests
+========================
+Verifies the shared BaseEngine plumbing.
+
+Tests:
+1. Spool Cleanup: extract_bytes() leaves no temp file behind, on success or failure.
+"""
+
+import asyncio
+
+import pytest
+
+from app.engines import base
+from app.engines.base import BaseEngine
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+class _EchoEngine(BaseEngine):
+    async def extract(self, file_path):
+        return await self._simple_fallback(file_path)
+
+
+@pytest.fixture
+def spool_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(base, "_spool_dir_for", lambda size: str(tmp_path))
+    return tmp_path
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_spool_cleanup(spool_dir):
+    """Ensure spooled uploads are removed, including partial writes."""
+    engine = _EchoEngine()
+
+    chunks = asyncio.run(engine.extract_bytes(b"hello\n\nworld", "notes.txt"))
+    assert [c.text for c in chunks] == ["hello", "world"]
+    assert list(spool_dir.iterdir()) == []
+
+    # The write itself fails after the file was created
+    with pytest.raises(TypeError):
+        asyncio.run(engine.extract_bytes("not bytes", "broken.pdf"))
+    assert list(spool_dir.iterdir()) == []
@@ -217,3 +217,62 @@ def test_system_resource_access():
         resource_tenant_id="tenant-a",
         resource_user_id="system",
     ) is False
+
+
+def test_context_is_frozen(context_admin_tenant_a):
+    """Ensure cached role flags cannot go stale after construction."""
+    from pydantic import ValidationError
+
+    assert context_admin_tenant_a.is_admin is True
+    with pytest.raises(ValidationError):
+        context_admin_tenant_a.roles = (Role.VIEWER,)
+    assert context_admin_tenant_a.is_admin is True
+
+
+def test_filter_accessible_resources(context_tenant_a_user_a, context_admin_tenant_a):
+    """Ensure post-query filtering matches can_access and keeps order."""
+    resources = [
+        {"id": "own-private", "tenant_id": "tenant-a", "user_id": "user-a", "access_level": "private"},
+        {"id": "other-private", "tenant_id": "tenant-a", "user_id": "user-b", "access_level": "private"},
+        {"id": "team-eng", "tenant_id": "tenant-a", "user_id": "user-b", "access_level": "team", "acl_groups": ["eng"]},
+        {"id": "team-ops", "tenant_id": "tenant-a", "user_id": "user-b", "access_level": "team", "acl_groups": ["ops"]},
+        {"id": "proj-x", "tenant_id": "tenant-a", "user_id": "user-b", "access_level": "project", "project_id": "proj-x"},
+        {"id": "proj-y", "tenant_id": "tenant-a", "user_id": "user-b", "access_level": "project", "project_id": "proj-y"},
+        {"id": "tenant-wide", "tenant_id": "tenant-a", "user_id": "user-b", "access_level": "tenant"},
+        {"id": "system", "tenant_id": "tenant-a", "user_id": "system", "access_level": "tenant"},
+        {"id": "cross-tenant", "tenant_id": "tenant-b", "user_id": "user-a", "access_level": "tenant"},
+        {"id": "legacy-own", "user_id": "user-a"},
+        {"id": "legacy-other", "user_id": "user-b"},
+    ]
+
+    visible = ResourceAccessPolicy.filter_accessible_resources(context_tenant_a_user_a, resources)
+    assert [r["id"] for r in visible] == [
+        "own-private", "team-eng", "proj-x", "tenant-wide", "legacy-own",
+    ]
+
+    # Admin sees everything in their tenant, but never cross-tenant
+    visible = ResourceAccessPolicy.filter_accessible_resources(context_admin_tenant_a, resources)
+    assert "cross-tenant" not in [r["id"] for r in visible]
+    assert "other-private" in [r["id"] for r in visible]
+    assert "system" in [r["id"] for r in visible]
+
+
+def test_build_query_filter(context_tenant_a_user_a, context_admin_tenant_a):
+    """Ensure SQL-level filtering always scopes to the caller's tenant."""
+    from sqlalchemy import select
+
+    def where_sql(ctx, model):
+        query = ResourceAccessPolicy.build_query_filter(ctx, select(model.id), model)
+        return str(query.whereclause.compile(compile_kwargs={"literal_binds": True}))
+
+    sql = where_sql(context_tenant_a_user_a, Document)
+    assert "documents.tenant_id = 'tenant-a'" in sql
+    assert "documents.user_id = 'user-a'" in sql
+    assert "documents.project_id = 'proj-x'" in sql
+    assert "documents.acl_groups" in sql
+
+    # Cached clause is reused for the same identity
+    assert where_sql(context_tenant_a_user_a, Document) == sql
+
+    # Admin: tenant isolation only
+    assert where_sql(context_admin_tenant_a, Document) == "documents.tenant_id = 'tenant-a'"
@@ -8,8 +8,12 @@ No external dependencies required (uses Python stdlib markdown-like processing).
 import os
 import re
 import sys
+import json
 import shutil
+import hashlib
 import html
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
 TEMPLATE_DIR = os.path.join(DOCS_DIR, "_template")
@@ -20,31 +24,126 @@ SITE_URL = "https://derekbmoore.github.io"
 # Page metadata extracted from YAML front matter
 PAGES = []
 
+# Below this many pages, worker start-up costs more than rendering
+PARALLEL_MIN_PAGES = 32
+
+# Rendered-page hashes from the previous build (kept out of _site so it
+# is never deployed); unchanged pages are not re-rendered
+CACHE_PATH = os.path.join(DOCS_DIR, ".build-cache.json")
+
+# Template placeholders, substituted in a single scan. Pages are assembled
+# as UTF-8 bytes so the shared template/nav/URLs are encoded only once.
+_PLACEHOLDER_RE = re.compile(rb'\{\{(TITLE|NAV|CONTENT|BASE_URL|SITE_URL|CURRENT_PAGE)\}\}')
+
+# Front matter: the block between the leading "---" and the next "---",
+# then one "key: value" per line with whitespace and quotes trimmed
+_FM_RE = re.compile(r'\A---(.*?)---(.*)\Z', re.S)
+_FM_LINE_RE = re.compile(
+    r'^[^\S\n]*([^:\n]*?)[^\S\n]*:[^\S\n]*"*\'*(.*?)\'*"*[^\S\n]*$', re.M
+)
+
+# Patterns used by the converter, compiled once at import
+_JEKYLL_CLASS_RE = re.compile(r'\{:\s*[^}]+\}')
+_SEP_CELL_RE = re.compile(r'^[-:]+$')
+# Inline markup in one pass; alternative order is precedence
+# (image before link, bold+italic before bold before italic).
+# Link text stops at "[" and targets allow only one level of balanced
+# "(...)" (e.g. Wikipedia URLs), so an unclosed run of brackets is
+# scanned once, not once per bracket (quadratic on long lines). The
+# emphasis alternatives cannot backtrack into each other: their closers
+# are literals and italic's two branches start differently.
+_INLINE_RE = re.compile(
+    r'!\[(?P<img_alt>[^\[\]]*)\]\((?!\))(?P<img_src>[^()]*(?:\([^()]*\)[^()]*)*)\)'
+    r'|\[(?P<a_txt>[^\[\]]+)\]\((?!\))(?P<a_href>[^()]*(?:\([^()]*\)[^()]*)*)\)'
+    r'|\*\*\*(?P<bi>.+?)\*\*\*'
+    r'|\*\*(?P<b>.+?)\*\*'
+    r'|\*(?P<i>(?:\*\*[^*]+\*\*|[^*])+)\*'
+    r'|`(?P<code>[^`]+)`'
+)
+# First characters that can open a non-paragraph block (heading, table,
+# list, horizontal rule, code fence)
+_BLOCK_START_CHARS = frozenset("#|-*`")
+_NUM_LIST_RE = re.compile(r'^\s*\d+\.\s+')
+# Jekyll-only lines (details/summary TOC blocks, kramdown TOC markers)
+_SKIP_RE = re.compile(
+    r'<details|</details>|<summary>|\{:toc\}|1\. TOC'
+    r'|^\s*\{: \.text-delta|^\s*\{: \.no_toc \}\s*$'
+)
+
+
+class _SlugTable(dict):
+    """
+    str.translate() table for heading slugs: keeps word characters,
+    whitespace and "-", deletes everything else. Entries are filled on
+    first sight of each code point, so non-ASCII text is covered without
+    a full Unicode map.
+    """
+
+    def __missing__(self, cp: int):
+        ch = chr(cp)
+        keep = ch.isalnum() or ch.isspace() or ch in "_-"
+        self[cp] = cp if keep else None
+        return self[cp]
+
+
+_SLUG_TABLE = _SlugTable()
+
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """Extract YAML front matter and body from markdown content."""
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            meta = {}
-            for line in parts[1].strip().split("\n"):
-                if ":" in line:
-                    key, val = line.split(":", 1)
-                    val = val.strip().strip('"').strip("'")
-                    # Handle multi-line (>-) by just taking what we have
-                    meta[key.strip()] = val
-            return meta, parts[2].strip()
-    return {}, content
+    m = _FM_RE.match(content)
+    if not m:
+        return {}, content
+    # Multi-line values (>-) just keep what is on the key's line
+    return dict(_FM_LINE_RE.findall(m.group(1))), m.group(2).strip()
+
+
+def _inline_repl(m: re.Match) -> str:
+    """Render one _INLINE_RE match; link text and emphasis may nest."""
+    kind = m.lastgroup
+    if kind == "img_src":
+        return f'<img src="{m["img_src"]}" alt="{m["img_alt"]}">'
+    if kind == "a_href":
+        return f'<a href="{m["a_href"]}">{_INLINE_RE.sub(_inline_repl, m["a_txt"])}</a>'
+    if kind == "bi":
+        return f'<strong><em>{_INLINE_RE.sub(_inline_repl, m["bi"])}</em></strong>'
+    if kind == "b":
+        return f'<strong>{_INLINE_RE.sub(_inline_repl, m["b"])}</strong>'
+    if kind == "i":
+        return f'<em>{_INLINE_RE.sub(_inline_repl, m["i"])}</em>'
+    return f'<code>{m["code"]}</code>'
+
+
+def _inline(text: str) -> str:
+    """Process inline markdown (images, links, emphasis, code)."""
+    text = _INLINE_RE.sub(_inline_repl, text)
+    # Em dash
+    text = text.replace(' — ', ' — ')
+    return text
 
 
 def strip_jekyll_classes(text: str) -> str:
     """Remove Jekyll/Kramdown class annotations like {: .fs-9 }."""
-    return re.sub(r'\{:\s*[^}]+\}', '', text)
+    return _JEKYLL_CLASS_RE.sub('', text)
 
 
 def md_to_html(md: str) -> str:
     """Convert markdown to HTML (lightweight, no dependencies)."""
     md = strip_jekyll_classes(md)
+    if not md.strip():
+        return ""
+    # Single-line bodies (stubs, redirects) whose first character rules out
+    # every block construct and that carry no Jekyll skip marker can only
+    # be one paragraph, so skip the block state machine for them.
+    line = md.strip("\n")
+    if (
+        "\n" not in line
+        and line.lstrip()[:1] not in _BLOCK_START_CHARS
+        and not line.lstrip()[:1].isdigit()
+        and not ("<" in line or "{" in line or "TOC" in line)
+    ):
+        return f"<p>{_inline(line)}</p>"
+
     lines = md.split("\n")
     out = []
     in_code = False
@@ -56,206 +155,309 @@ def md_to_html(md: str) -> str:
     list_lines = []
     in_details = False
 
+    # `out` holds flat HTML fragments; every block ends with a "\n"
+    # separator element and the whole page is joined once at the end.
+
     def flush_table():
         nonlocal table_lines, in_table
         if not table_lines:
-            return ""
-        rows = []
+            return
+        out.append('<div class="table-wrap"><table>')
         for i, row in enumerate(table_lines):
             cells = [c.strip() for c in row.strip("|").split("|")]
             # Skip separator row
-            if all(re.match(r'^[-:]+$', c) for c in cells):
+            if all(_SEP_CELL_RE.match(c) for c in cells):
                 continue
-            tag = "th" if i == 0 else "td"
-            cells_html = "".join(f"<{tag}>{inline(c)}</{tag}>" for c in cells)
-            rows.append(f"<tr>{cells_html}</tr>")
+            open_tag, close_tag = ("<th>", "</th>") if i == 0 else ("<td>", "</td>")
+            out.append("<tr>")
+            for c in cells:
+                out.extend((open_tag, _inline(c), close_tag))
+            out.append("</tr>")
+        out.extend(("</table></div>", "\n"))
         table_lines = []
         in_table = False
-        return f'<div class="table-wrap"><table>{"".join(rows)}</table></div>'
 
     def flush_list():
         nonlocal list_lines, in_list
         if not list_lines:
-            return ""
-        items = "".join(f"<li>{inline(l)}</li>" for l in list_lines)
+            return
+        out.append("<ul>")
+        for l in list_lines:
+            out.extend(("<li>", _inline(l), "</li>"))
+        out.extend(("</ul>", "\n"))
         list_lines = []
         in_list = False
-        return f"<ul>{items}</ul>"
-
-    def inline(text: str) -> str:
-        """Process inline markdown."""
-        # Images
-        text = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', r'<img src="\2" alt="\1">', text)
-        # Links
-        text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
-        # Bold + italic
-        text = re.sub(r'\*\*\*(.+?)\*\*\*', r'<strong><em>\1</em></strong>', text)
-        # Bold
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-        # Italic
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-        # Inline code
-        text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
-        # Em dash
-        text = text.replace(' — ', ' — ')
-        return text
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Skip details/TOC blocks (Jekyll specific)
-        if '<details' in line or '{:toc}' in line or '1. TOC' in line:
-            i += 1
-            continue
-        if '</details>' in line:
-            i += 1
-            continue
-        if line.strip().startswith('{: .text-delta'):
-            i += 1
-            continue
-        if line.strip() == '{: .no_toc }':
-            i += 1
-            continue
-        if '<summary>' in line:
-            i += 1
+
+    for line in lines:
+        # Lines are classified with cheap prefix checks on the stripped
+        # text; regexes only run once a line's first character qualifies.
+        stripped = line.strip()
+
+        # Skip details/TOC blocks (Jekyll specific). Every marker contains
+        # "<", "{" or "TOC", so most lines never reach the regex.
+        if ("<" in line or "{" in line or "TOC" in line) and _SKIP_RE.search(line):
             continue
 
         # Code blocks
-        if line.strip().startswith("```"):
+        if stripped.startswith("```"):
             if in_code:
                 escaped = html.escape("\n".join(code_lines))
                 lang_class = f' class="language-{code_lang}"' if code_lang else ''
-                out.append(f'<pre><code{lang_class}>{escaped}</code></pre>')
+                out.extend(("<pre><code", lang_class, ">", escaped, "</code></pre>", "\n"))
                 code_lines = []
                 in_code = False
             else:
                 # Flush any open blocks
                 if in_table:
-                    out.append(flush_table())
+                    flush_table()
                 if in_list:
-                    out.append(flush_list())
+                    flush_list()
                 in_code = True
-                code_lang = line.strip().replace("```", "").strip()
-            i += 1
+                code_lang = stripped.replace("```", "").strip()
             continue
 
         if in_code:
             code_lines.append(line)
-            i += 1
             continue
 
         # Table rows
-        if "|" in line and line.strip().startswith("|"):
+        if stripped.startswith("|"):
             if in_list:
-                out.append(flush_list())
+                flush_list()
             in_table = True
             table_lines.append(line)
-            i += 1
             continue
         elif in_table:
-            out.append(flush_table())
+            flush_table()
 
-        # List items
-        if re.match(r'^\s*[-*]\s+', line):
+        # List items ("- " / "* " after optional indent)
+        if stripped[:1] in ("-", "*") and line.lstrip()[1:2].isspace():
             if in_table:
-                out.append(flush_table())
+                flush_table()
             in_list = True
-            list_lines.append(re.sub(r'^\s*[-*]\s+', '', line))
-            i += 1
+            list_lines.append(line.lstrip()[1:].lstrip())
             continue
-        elif in_list and line.strip() == "":
-            out.append(flush_list())
-            i += 1
+        elif in_list and not stripped:
+            flush_list()
             continue
         elif in_list and not line.startswith(" "):
-            out.append(flush_list())
+            flush_list()
 
         # Numbered list
-        if re.match(r'^\s*\d+\.\s+', line):
-            content = re.sub(r'^\s*\d+\.\s+', '', line)
-            out.append(f"<ol><li>{inline(content)}</li></ol>")
-            i += 1
+        if stripped[:1].isdigit() and _NUM_LIST_RE.match(line):
+            content = _NUM_LIST_RE.sub('', line)
+            out.extend(("<ol><li>", _inline(content), "</li></ol>", "\n"))
             continue
 
-        # Headings
-        m = re.match(r'^(#{1,6})\s+(.*)', line)
-        if m:
+        # Headings: 1-6 '#' at column 0, then whitespace
+        hashes = len(line) - len(line.lstrip("#")) if line[:1] == "#" else 0
+        if 0 < hashes <= 6 and line[hashes:hashes + 1].isspace():
             if in_list:
-                out.append(flush_list())
-            level = len(m.group(1))
-            text = m.group(2)
-            slug = re.sub(r'[^\w\s-]', '', text.lower()).strip().replace(' ', '-')
-            out.append(f'<h{level} id="{slug}">{inline(text)}</h{level}>')
-            i += 1
+                flush_list()
+            level = str(hashes)
+            text = line[hashes:].lstrip()
+            slug = text.lower().translate(_SLUG_TABLE).strip().replace(' ', '-')
+            out.extend(("<h", level, ' id="', slug, '">', _inline(text), "</h", level, ">", "\n"))
             continue
 
         # Horizontal rule
-        if re.match(r'^---+$', line.strip()):
-            i += 1
+        if stripped.startswith("---") and not stripped.strip("-"):
             continue
 
         # Empty line
-        if line.strip() == "":
-            i += 1
+        if not stripped:
             continue
 
         # Paragraph
         if in_list:
-            out.append(flush_list())
-        out.append(f"<p>{inline(line)}</p>")
-        i += 1
+            flush_list()
+        out.extend(("<p>", _inline(line), "</p>", "\n"))
 
     # Flush remaining
     if in_table:
-        out.append(flush_table())
+        flush_table()
     if in_list:
-        out.append(flush_list())
-
-    return "\n".join(out)
+        flush_list()
+
+    # Drop the separator after the last block
+    if out:
+        out.pop()
+    return "".join(out)
+
+
+def _fill_placeholders(template: bytes, subs: dict[bytes, bytes]) -> bytes:
+    """Replace {{NAME}} placeholders in one pass; unknown names are kept."""
+    return _PLACEHOLDER_RE.sub(lambda m: subs.get(m[1], m[0]), template)
+
+
+def _compile_template(template: bytes, stable: dict[bytes, bytes]) -> list[bytes]:
+    """
+    Split the template once into [literal, name, literal, name, ..., literal].
+
+    Placeholders in *stable* (same on every page) are resolved into the
+    literals here, so per-page filling is a join with no scanning.
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    compiled = [parts[0]]
+    for name, literal in zip(parts[1::2], parts[2::2]):
+        if name in stable:
+            compiled[-1] += stable[name] + literal
+        else:
+            compiled += (name, literal)
+    return compiled
+
+
+def _fill_compiled(compiled: list[bytes], subs: dict[bytes, bytes]) -> bytes:
+    """Fill the per-page placeholders of a _compile_template() result."""
+    parts = compiled[:]
+    for i in range(1, len(parts), 2):
+        parts[i] = subs[parts[i]]
+    return b"".join(parts)
+
+
+def _copy_if_changed(src: str, dst: str) -> None:
+    """copy2() unless dst already matches src's size and mtime."""
+    # copy2 preserves mtime, so files copied by the last build match
+    try:
+        s, d = os.stat(src), os.stat(dst)
+        if s.st_size == d.st_size and s.st_mtime_ns == d.st_mtime_ns:
+            return
+    except FileNotFoundError:
+        pass
+    shutil.copy2(src, dst)
+
+
+def _sync_tree(src: str, dst: str) -> None:
+    """Mirror src into dst, copying only new or changed files."""
+    expected = set()
+    for root, dirs, files in os.walk(src):
+        rel = os.path.relpath(root, src)
+        target = os.path.normpath(os.path.join(dst, rel))
+        os.makedirs(target, exist_ok=True)
+        expected.add(target)
+        for name in files:
+            out = os.path.join(target, name)
+            expected.add(out)
+            _copy_if_changed(os.path.join(root, name), out)
+    # Remove files and directories that no longer exist in src
+    for root, dirs, files in os.walk(dst, topdown=False):
+        for name in files:
+            path = os.path.join(root, name)
+            if path not in expected:
+                os.remove(path)
+        for name in dirs:
+            path = os.path.join(root, name)
+            if path not in expected:
+                shutil.rmtree(path)
+
+
+def _out_name(p: dict) -> str:
+    return "index.html" if p["slug"] == "" else f'{p["slug"]}.html'
+
+
+def _page_key(context: bytes, p: dict) -> str:
+    """Hash of everything a markdown page's output depends on."""
+    h = hashlib.blake2b(context, digest_size=16)
+    h.update("\0".join((p["title"], p["slug"], p["body"])).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _load_cache() -> dict:
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _render_page(
+    p: dict,
+    template: list[bytes],
+    nav_html: bytes,
+    base_url: bytes,
+    site_url: bytes,
+    out_dir: str,
+) -> str:
+    """Render and write one page; returns its status line(s)."""
+    out_name = _out_name(p)
+    status = []
+
+    # Custom HTML pages: use companion .html file with placeholder replacement
+    if p.get("custom_html"):
+        custom_path = os.path.join(DOCS_DIR, f'{p["slug"]}.html')
+        if os.path.exists(custom_path):
+            with open(custom_path, "rb") as f:
+                page_html = f.read()
+            page_html = _fill_placeholders(page_html, {
+                b"NAV": nav_html,
+                b"BASE_URL": base_url,
+                b"SITE_URL": site_url,
+                b"CURRENT_PAGE": p["slug"].encode("utf-8"),
+            })
+            out_path = os.path.join(out_dir, out_name)
+            with open(out_path, "wb") as f:
+                f.write(page_html)
+            return f"  ✓ {out_name} (custom HTML)"
+        status.append(f"  ⚠ {p['slug']}.html not found, falling back to markdown")
+
+    body_html = md_to_html(p["body"])
+
+    # NAV / BASE_URL / SITE_URL are already resolved in the template
+    page_html = _fill_compiled(template, {
+        b"TITLE": p["title"].encode("utf-8"),
+        b"CONTENT": body_html.encode("utf-8"),
+        b"CURRENT_PAGE": p["slug"].encode("utf-8"),
+    })
+
+    out_path = os.path.join(out_dir, out_name)
+    with open(out_path, "wb") as f:
+        f.write(page_html)
+    status.append(f"  ✓ {out_name}")
+    return "\n".join(status)
 
 
 def build():
     """Build the static site."""
-    # Clean output
-    if os.path.exists(OUT_DIR):
-        shutil.rmtree(OUT_DIR)
+    # Output dir is kept between builds so unchanged pages can be reused;
+    # anything this build does not produce is pruned at the end.
     os.makedirs(OUT_DIR, exist_ok=True)
 
     # Read template
     template_path = os.path.join(TEMPLATE_DIR, "template.html")
-    with open(template_path, "r") as f:
+    with open(template_path, "rb") as f:
         template = f.read()
 
     # Copy CSS
     css_src = os.path.join(TEMPLATE_DIR, "style.css")
     css_dst = os.path.join(OUT_DIR, "style.css")
-    shutil.copy2(css_src, css_dst)
+    _copy_if_changed(css_src, css_dst)
 
     # Copy assets
     assets_src = os.path.join(DOCS_DIR, "assets")
     assets_dst = os.path.join(OUT_DIR, "assets")
     if os.path.exists(assets_src):
-        if os.path.exists(assets_dst):
-            shutil.rmtree(assets_dst)
-        shutil.copytree(assets_src, assets_dst)
+        _sync_tree(assets_src, assets_dst)
+    elif os.path.exists(assets_dst):
+        shutil.rmtree(assets_dst)
 
     # Collect pages
     pages = []
-    for fname in os.listdir(DOCS_DIR):
-        if not fname.endswith(".md"):
-            continue
-        filepath = os.path.join(DOCS_DIR, fname)
-        with open(filepath, "r") as f:
+    with os.scandir(DOCS_DIR) as it:
+        entries = [e for e in it if e.name.endswith(".md") and e.is_file()]
+    for entry in entries:
+        fname = entry.name
+        with open(entry.path, "r", encoding="utf-8") as f:
             content = f.read()
         meta, body = parse_frontmatter(content)
         slug = fname.replace(".md", "")
         if slug == "index":
             slug = ""
+        # Slugs and titles are reused as nav text, dict keys and page
+        # values throughout the build; intern them once.
         pages.append({
-            "title": meta.get("title", fname.replace(".md", "").replace("-", " ").title()),
+            "title": sys.intern(meta.get("title", fname.replace(".md", "").replace("-", " ").title())),
             "nav_order": int(meta.get("nav_order", 99)),
-            "slug": slug,
+            "slug": sys.intern(slug),
             "body": body,
             "filename": fname,
             "custom_html": meta.get("custom_html", "").lower() == "true",
@@ -263,52 +465,70 @@ def build():
 
     pages.sort(key=lambda p: p["nav_order"])
 
-    # Build nav HTML
-    nav_items = []
+    # Build nav HTML (once; shared by every page)
+    nav_html = "\n".join([
+        f'<a href="{BASE_URL}/{"" if p["slug"] == "" else _out_name(p)}" '
+        f'class="nav-link" data-page="{p["slug"]}">{p["title"]}</a>'
+        for p in pages
+    ])
+
+    nav_html = nav_html.encode("utf-8")
+    base_url = BASE_URL.encode("utf-8")
+    site_url = SITE_URL.encode("utf-8")
+
+    # Skip markdown pages whose inputs match the previous build. The
+    # builder's own source is part of the key so code changes invalidate.
+    with open(os.path.abspath(__file__), "rb") as f:
+        builder_src = f.read()
+    context = b"\0".join((builder_src, template, nav_html, base_url, site_url))
+    cache = _load_cache()
+    new_cache = {}
+    to_render = []
     for p in pages:
-        href = f'{BASE_URL}/' if p["slug"] == "" else f'{BASE_URL}/{p["slug"]}.html'
-        nav_items.append(
-            f'<a href="{href}" class="nav-link" data-page="{p["slug"]}">'
-            f'{p["title"]}</a>'
-        )
-    nav_html = "\n".join(nav_items)
-
-    # Build each page
-    for p in pages:
-        out_name = "index.html" if p["slug"] == "" else f'{p["slug"]}.html'
-
-        # Custom HTML pages: use companion .html file with placeholder replacement
-        if p.get("custom_html"):
-            custom_path = os.path.join(DOCS_DIR, f'{p["slug"]}.html')
-            if os.path.exists(custom_path):
-                with open(custom_path, "r") as f:
-                    page_html = f.read()
-                page_html = page_html.replace("{{NAV}}", nav_html)
-                page_html = page_html.replace("{{BASE_URL}}", BASE_URL)
-                page_html = page_html.replace("{{SITE_URL}}", SITE_URL)
-                page_html = page_html.replace("{{CURRENT_PAGE}}", p["slug"])
-                out_path = os.path.join(OUT_DIR, out_name)
-                with open(out_path, "w") as f:
-                    f.write(page_html)
-                print(f"  ✓ {out_name} (custom HTML)")
+        out_name = _out_name(p)
+        if p["custom_html"]:
+            to_render.append(p)
+            continue
+        key = new_cache[out_name] = _page_key(context, p)
+        if cache.get(out_name) != key or not os.path.exists(os.path.join(OUT_DIR, out_name)):
+            to_render.append(p)
+
+    # Build each page (pages are independent once nav_html exists)
+    render = partial(
+        _render_page,
+        template=_compile_template(template, {
+            b"NAV": nav_html,
+            b"BASE_URL": base_url,
+            b"SITE_URL": site_url,
+        }),
+        nav_html=nav_html,
+        base_url=base_url,
+        site_url=site_url,
+        out_dir=OUT_DIR,
+    )
+    if len(to_render) >= PARALLEL_MIN_PAGES:
+        with ProcessPoolExecutor() as ex:
+            statuses = list(ex.map(render, to_render))
+    else:
+        statuses = map(render, to_render)
+    for status in statuses:
+        print(status)
+    if len(to_render) < len(pages):
+        print(f"  · {len(pages) - len(to_render)} unchanged page(s) reused")
+
+    # Prune outputs of pages that no longer exist
+    keep = {"style.css", "assets", *(_out_name(p) for p in pages)}
+    with os.scandir(OUT_DIR) as it:
+        for entry in it:
+            if entry.name in keep:
                 continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
             else:
-                print(f"  ⚠ {p['slug']}.html not found, falling back to markdown")
-
-        body_html = md_to_html(p["body"])
-
-        page_html = template.replace("{{TITLE}}", p["title"])
-        page_html = page_html.replace("{{NAV}}", nav_html)
-        page_html = page_html.replace("{{CONTENT}}", body_html)
-        page_html = page_html.replace("{{CONTENT}}", body_html)
-        page_html = page_html.replace("{{BASE_URL}}", BASE_URL)
-        page_html = page_html.replace("{{SITE_URL}}", SITE_URL)
-        page_html = page_html.replace("{{CURRENT_PAGE}}", p["slug"])
-
-        out_path = os.path.join(OUT_DIR, out_name)
-        with open(out_path, "w") as f:
-            f.write(page_html)
-        print(f"  ✓ {out_name}")
+                os.remove(entry.path)
+
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump(new_cache, f, indent=2, sort_keys=True)
 
     print(f"\nBuilt {len(pages)} pages → {OUT_DIR}")
 